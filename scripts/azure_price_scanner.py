@@ -7,15 +7,25 @@ Collects all data needed for your dashboard with proper filtering and error hand
 """
 
 import argparse
+import functools
 import json
+import logging
+import math
 import re
 import sys
 import time
 import random
 import os  # Added for reliable path handling
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 # Try to import the VM specs lookup
 try:
@@ -23,22 +33,152 @@ try:
     VM_SPECS_AVAILABLE = True
 except ImportError:
     VM_SPECS_AVAILABLE = False
-    print("Note: vm_specs_lookup.py not found. Using basic parsing only.")
+    logger.warning("vm_specs_lookup.py not found. Using basic parsing only.")
+
+# orjson decodes API pages and encodes the output several times faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow is only needed for the optional Parquet export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Constants
 AZURE_API_URL = "https://prices.azure.com/api/retail/prices"
 DEFAULT_OUTPUT_RELATIVE = "../dashboard/data/azure_prices.json"
 USER_AGENT = "Azure-Price-Intelligence-Dashboard/1.0"
+DEFAULT_WORKERS = 8
+HTTP_POOL_SIZE = 32
+MAX_RETRIES = 5
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+PROGRESS_LOG_INTERVAL = 10  # Pages between progress lines at INFO level
+MAX_HOURLY_PRICE = 1000  # Higher "hourly" prices are mislabelled non-consumption meters
+
+# The same SKU strings recur in every region, so per-SKU parsing is memoized
+PARSE_CACHE_SIZE = 8192
 
 # Regex patterns
-VCPU_PATTERN = re.compile(r'(\d+)\s*vCPU', re.IGNORECASE)
-RAM_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*GB', re.IGNORECASE)
+# vCPU count and memory size alternatives, so one pass over the text finds both
+SPEC_PATTERN = re.compile(r'(?P<vcpus>\d+)\s*vCPU|(?P<memory>\d+(?:\.\d+)?)\s*GB', re.IGNORECASE)
 SERIES_PATTERN = re.compile(r'([A-Za-z]+)\d*[a-z]*\s*v?(\d+)', re.IGNORECASE)
+# Always matches; an empty group means no family letters follow the optional prefix
+FAMILY_FALLBACK_PATTERN = re.compile(r'(?:Standard_)?([A-Za-z]*)')
+HOUR_PATTERN = re.compile(r'hour', re.IGNORECASE)
+EXCLUSION_PATTERN = re.compile(
+    r'reservation|sql|database|storage|bandwidth|snapshot|backup|oracle|premium ssd|managed disk',
+    re.IGNORECASE
+)
+# Single-pass OS/spot detection: zero-width lookahead reports every marker, even overlapping ones
+TEXT_MARKERS_PATTERN = re.compile(
+    r'(?=(?P<windows>windows)|(?P<linux>linux|ubuntu|red hat|rhel|suse|debian|centos)|(?P<spot>spot|low priority))',
+    re.IGNORECASE
+)
+
+class VMRecord(NamedTuple):
+    """One processed VM price row; fields are serialised in this order"""
+    name: Optional[str]
+    family: Optional[str]
+    os: str
+    isSpot: bool
+    vcpus: Optional[int]
+    memoryGB: Optional[float]
+    pricePerHour: float
+    region: str
+
+class SeriesInfo(NamedTuple):
+    """Series, family and size parsed from a SKU name; cached and shared, hence immutable"""
+    series: Optional[str]
+    family: Optional[str]
+    size: Optional[str]
+
+class ScanSummary:
+    """Running summary statistics, updated page by page while records are collected"""
+    
+    def __init__(self):
+        self.count = 0
+        self.spot_count = 0
+        self.price_sum = 0.0
+        self.min_price = math.inf
+        self.max_price = -math.inf
+        self.regions, self.families, self.os_types = set(), set(), set()
+    
+    def add(self, records: List[VMRecord]) -> None:
+        # Fold every statistic into a single pass. Records are unpacked positionally
+        # (VMRecord field order) and totals kept in locals, avoiding attribute lookups.
+        regions, families, os_types = self.regions, self.families, self.os_types
+        spot_count, price_sum = self.spot_count, self.price_sum
+        min_price, max_price = self.min_price, self.max_price
+        
+        for _, family, os_type, is_spot, _, _, price, region in records:
+            price_sum += price
+            if price < min_price: min_price = price
+            if price > max_price: max_price = price
+            regions.add(region)
+            families.add(family)
+            os_types.add(os_type)
+            if is_spot: spot_count += 1
+        
+        self.count += len(records)
+        self.spot_count, self.price_sum = spot_count, price_sum
+        self.min_price, self.max_price = min_price, max_price
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count: return {}
+        
+        # Only a few dozen distinct values exist, so drop missing ones here rather than testing every row
+        regions, families, os_types = (
+            sorted(values - {None, ""}) for values in (self.regions, self.families, self.os_types)
+        )
+        
+        return {
+            "count": self.count,
+            "regionsCount": len(regions),
+            "regions": regions,
+            "familiesCount": len(families),
+            "families": families,
+            "osTypes": os_types,
+            "spotCount": self.spot_count,
+            "avgPricePerHour": round(self.price_sum / self.count, 6),
+            "minPricePerHour": round(self.min_price, 6),
+            "maxPricePerHour": round(self.max_price, 6),
+        }
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _scan_text_markers(product_name: str, sku_name: str) -> frozenset:
+    """Return the marker groups (windows/linux/spot) found in the product and SKU names"""
+    combined_text = f"{product_name or ''} {sku_name or ''}"
+    return frozenset(match.lastgroup for match in TEXT_MARKERS_PATTERN.finditer(combined_text))
+
+def _os_type_from_markers(markers: frozenset) -> str:
+    if "windows" in markers:
+        return "Windows"
+    if "linux" in markers:
+        return "Linux"
+    return "Unknown"
 
 class AzurePriceScanner:
     def __init__(self):
+        self.summary = ScanSummary()
         self.session = requests.Session()
-        self.session.headers.update({'User-Agent': USER_AGENT})
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json',
+        })
+        # Keep enough pooled keep-alive connections for the concurrent page fetches, and retry
+        # throttling/transient server errors (honouring Retry-After) instead of ending the scan
+        retries = Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_SECONDS,
+                        status_forcelist=RETRY_STATUS_CODES, allowed_methods=["GET"],
+                        respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+        self.session.mount("https://", adapter)
     
     def build_query_filter(self, os_filter: str) -> str:
         """Build filter - only service name, we handle consumption detection ourselves"""
@@ -52,73 +192,57 @@ class AzurePriceScanner:
     def is_consumption_pricing(self, item: Dict[str, Any]) -> bool:
         """
         Smart consumption detection since Azure API is unreliable.
+        The MAX_HOURLY_PRICE ceiling is applied by _process_item, which parses the price anyway.
         """
-        unit = (item.get("unitOfMeasure") or "").lower()
-        if "hour" not in unit:
+        get = item.get
+        if not HOUR_PATTERN.search(get("unitOfMeasure") or ""):
             return False
         
-        exclusion_terms = [
-            "reservation", "sql", "database", "storage", "bandwidth", 
-            "snapshot", "backup", "oracle", "premium ssd", "managed disk"
-        ]
-        
-        combined_text = f"{item.get('meterName', '')} {item.get('productName', '')} {item.get('skuName', '')}".lower()
-        if any(term in combined_text for term in exclusion_terms):
-            return False
-        
-        try:
-            price = float(item.get("retailPrice") or item.get("unitPrice") or 0)
-            if price > 1000:
+        # Scan each field separately so a hit in the meter name returns before touching the rest
+        for field in ("meterName", "productName", "skuName"):
+            text = get(field)
+            if text and EXCLUSION_PATTERN.search(text):
                 return False
-        except (ValueError, TypeError):
-            pass
-            
+        
         return True
     
-    def parse_vm_specs(self, product_name: str, sku_name: str, vm_name: str) -> Dict[str, Any]:
-        """Enhanced VM specs parsing using lookup table when available"""
-        specs = {"vcpus": None, "memoryGB": None}
+    @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def parse_vm_specs(product_name: str, sku_name: str, vm_name: str) -> Tuple[Optional[int], Optional[float]]:
+        """Enhanced VM specs parsing using lookup table when available, returns (vcpus, memoryGB) (cached)"""
+        vcpus = memory_gb = None
         
         if VM_SPECS_AVAILABLE:
-            lookup_specs = get_vm_specs(vm_name)
-            if lookup_specs:
-                specs.update(lookup_specs)
+            vcpus, memory_gb = get_vm_specs(vm_name)
 
-        if not specs.get("vcpus") or not specs.get("memoryGB"):
-            search_text = f"{product_name or ''} {sku_name or ''}".lower()
-            
-            if not specs.get("vcpus"):
-                vcpu_match = VCPU_PATTERN.search(search_text)
-                if vcpu_match:
-                    try:
-                        specs["vcpus"] = int(vcpu_match.group(1))
-                    except (ValueError, TypeError): pass
-            
-            if not specs.get("memoryGB"):
-                ram_match = RAM_PATTERN.search(search_text)
-                if ram_match:
-                    try:
-                        specs["memoryGB"] = float(ram_match.group(1))
-                    except (ValueError, TypeError): pass
+        if not vcpus or not memory_gb:
+            search_text = f"{product_name or ''} {sku_name or ''}"
+            # Only the first match of each kind counts, and only for a value still missing
+            need_vcpus, need_memory = not vcpus, not memory_gb
+            for match in SPEC_PATTERN.finditer(search_text):
+                if match.lastgroup == "vcpus":
+                    if need_vcpus:
+                        vcpus = int(match.group("vcpus"))
+                        need_vcpus = False
+                elif need_memory:
+                    memory_gb = float(match.group("memory"))
+                    need_memory = False
+                if not (need_vcpus or need_memory):
+                    break
         
-        return specs
+        return vcpus, memory_gb
     
-    def determine_os_type(self, product_name: str, sku_name: str) -> str:
-        combined_text = f"{product_name or ''} {sku_name or ''}".lower()
-        if "windows" in combined_text:
-            return "Windows"
-        
-        linux_indicators = ["linux", "ubuntu", "red hat", "rhel", "suse", "debian", "centos"]
-        if any(indicator in combined_text for indicator in linux_indicators):
-            return "Linux"
-            
-        return "Unknown"
+    @staticmethod
+    def determine_os_type(product_name: str, sku_name: str) -> str:
+        return _os_type_from_markers(_scan_text_markers(product_name, sku_name))
     
-    def is_spot_instance(self, sku_name: str, product_name: str) -> bool:
-        combined_text = f"{sku_name or ''} {product_name or ''}".lower()
-        return any(indicator in combined_text for indicator in ["spot", "low priority"])
+    @staticmethod
+    def is_spot_instance(sku_name: str, product_name: str) -> bool:
+        return "spot" in _scan_text_markers(product_name, sku_name)
     
-    def extract_series_info(self, sku_name: str, arm_sku_name: str) -> Dict[str, Optional[str]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+    def extract_series_info(sku_name: str, arm_sku_name: str) -> SeriesInfo:
         source_text = arm_sku_name or sku_name or ""
         series_match = SERIES_PATTERN.search(source_text)
         if series_match:
@@ -126,151 +250,291 @@ class AzurePriceScanner:
             generation = series_match.group(2)
             series = f"{family}v{generation}"
         else:
-            family_match = re.match(r'([A-Za-z]+)', source_text.replace("Standard_", ""))
-            family = family_match.group(1).upper() if family_match else None
+            family = FAMILY_FALLBACK_PATTERN.match(source_text).group(1).upper() or None
             series = family
         
-        return {"series": series, "family": family, "size": arm_sku_name or sku_name}
+        return SeriesInfo(series=series, family=family, size=arm_sku_name or sku_name)
+    
+    def _fetch_page(self, params: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """Fetch and decode a single page of the retail prices API"""
+        response = self.session.get(AZURE_API_URL, params=params, timeout=timeout)
+        response.raise_for_status()
+        return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    
+    def _fetch_and_process_page(self, params: Dict[str, Any], timeout: int,
+                                item_filter: Callable[[Dict[str, Any]], bool]) -> Tuple[int, List[VMRecord], Optional[str]]:
+        """Fetch one page and reduce it to processed records inside the worker thread.
+        
+        Returns (raw item count, records, next page link or None). Only the projected
+        records outlive this call, so raw page payloads are never queued in the fetch window.
+        """
+        data = self._fetch_page(params, timeout)
+        items = data.get("Items", [])
+        return len(items), self._process_page(items, item_filter), data.get("NextPageLink") or None
+    
+    @staticmethod
+    def _page_stride(next_page_link: str, item_count: int) -> int:
+        """Offset step between pages: the $skip in the server's next page link, else the page's item count"""
+        skip = parse_qs(urlparse(next_page_link).query).get("$skip")
+        try:
+            return int(skip[0]) if skip else item_count
+        except ValueError:
+            return item_count
     
     def fetch_vm_prices(self, os_filter: str = "both", include_spot: bool = False, 
                         regions: Optional[List[str]] = None, max_pages: int = 0, 
-                        timeout: int = 30) -> List[Dict[str, Any]]:
+                        timeout: int = 30, workers: int = DEFAULT_WORKERS,
+                        processes: int = 0) -> List[VMRecord]:
         all_items = []
-        next_url = None
-        page_count = 0
+        # Summarised as each page arrives, so no second pass over all_items is needed
+        self.summary = ScanSummary()
         
         # RESTORED: Generate random page limit if max_pages is 0
         if max_pages == 0:
             max_pages = random.randint(10, 100)
-            print(f"Random page limit set to: {max_pages} pages")
+            logger.info("Random page limit set to: %d pages", max_pages)
         
         query_filter = self.build_query_filter(os_filter)
         params = {"$filter": query_filter, "currencyCode": "USD"}
+        # Normalise the region filter and bake the CLI flags into the filter once per scan
+        region_set = frozenset(r.lower() for r in regions) if regions else None
+        
+        if processes > 0:
+            # Decoding and processing pages is CPU-bound and holds the GIL, so whole pages can be
+            # fetched and processed in worker processes instead; only the records are sent back.
+            # Each process fetches one page at a time, so `processes` replaces `workers`.
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_page_worker,
+                                           initargs=(include_spot, region_set))
+            fetch_page = _fetch_and_process_page_in_worker
+            workers = processes
+        else:
+            item_filter = self._build_item_filter(include_spot, region_set)
+            executor = ThreadPoolExecutor(max_workers=workers)
+            fetch_page = functools.partial(self._fetch_and_process_page, item_filter=item_filter)
         
-        print(f"Starting data collection with filter: {query_filter}")
-        print(f"Page limit: {max_pages} pages")
+        logger.info("Starting data collection with filter: %s", query_filter)
+        logger.info("Page limit: %d pages (%d concurrent requests)", max_pages, workers)
         
-        while True:
-            page_count += 1
-            if page_count > max_pages:
-                print(f"Reached maximum page limit ({max_pages})")
-                break
+        # Pages are addressed by $skip offset, so several can be in flight at once. The offset
+        # step is read from the first page's NextPageLink rather than assumed, and every later
+        # page must match it, so pages can neither overlap nor leave gaps. A sliding window then
+        # keeps `workers` requests busy while results are still consumed in page order.
+        in_flight = deque()
+        next_page = 0
+        page_stride = 0  # Unknown until the first page arrives
+        with executor:
+            def submit_next_page():
+                nonlocal next_page
+                page_params = {**params, "$skip": next_page * page_stride}
+                future = executor.submit(fetch_page, page_params, timeout)
+                in_flight.append((next_page, future))
+                next_page += 1
             
-            url = next_url or AZURE_API_URL
-            current_params = {} if next_url else params
+            # The first page is fetched on its own to learn the stride before the window opens
+            submit_next_page()
             
-            try:
-                response = self.session.get(url, params=current_params, timeout=timeout)
-                response.raise_for_status()
-                data = response.json()
-                
-                items = data.get("Items", [])
-                print(f"Page {page_count}: Processing {len(items)} items")
-                
-                for item in items:
-                    if self._should_include_item(item, include_spot, regions):
-                        processed_item = self._process_item(item)
-                        if processed_item:
-                            all_items.append(processed_item)
+            while in_flight:
+                page, future = in_flight.popleft()
+                page_count = page + 1
+                finished = False
+                try:
+                    item_count, records, next_page_link = future.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error("Error fetching page %d: %s", page_count, e)
+                    finished = True
+                except json.JSONDecodeError as e:
+                    logger.error("Error parsing JSON on page %d: %s", page_count, e)
+                    finished = True
+                else:
+                    logger.debug("Page %d: Processed %d items", page_count, item_count)
+                    all_items.extend(records)
+                    self.summary.add(records)
+                    # Progress is reported every few pages rather than per page
+                    if page_count % PROGRESS_LOG_INTERVAL == 0:
+                        logger.info("Fetched %d pages, %d items collected", page_count, len(all_items))
+                    
+                    if not next_page_link:
+                        logger.info("No more pages available.")
+                        finished = True
+                    else:
+                        if page == 0:
+                            page_stride = self._page_stride(next_page_link, item_count)
+                        if page_stride <= 0 or item_count != page_stride:
+                            logger.error("Page %d returned %d items but the page stride is %d; stopping the scan "
+                                         "so later pages do not overlap or leave gaps", page_count, item_count, page_stride)
+                            finished = True
                 
-                next_url = data.get("NextPageLink")
-                if not next_url:
-                    print("No more pages available.")
+                if finished:
+                    for _, pending in in_flight:
+                        pending.cancel()
                     break
                 
-                time.sleep(0.3)
-                
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching page {page_count}: {e}", file=sys.stderr)
-                break
-            except json.JSONDecodeError as e:
-                print(f"Error parsing JSON on page {page_count}: {e}", file=sys.stderr)
-                break
+                while len(in_flight) < workers and next_page < max_pages:
+                    submit_next_page()
+            else:
+                logger.info("Reached maximum page limit (%d)", max_pages)
         
-        print(f"Data collection complete. Total items: {len(all_items)}")
+        logger.info("Data collection complete. Total items: %d", len(all_items))
         return all_items
     
-    def _should_include_item(self, item: Dict[str, Any], include_spot: bool, 
-                             regions: Optional[List[str]]) -> bool:
-        if item.get("serviceName") != "Virtual Machines" or not self.is_consumption_pricing(item):
-            return False
+    def _process_page(self, items: List[Dict[str, Any]],
+                      item_filter: Callable[[Dict[str, Any]], bool]) -> List[VMRecord]:
+        """Filter and process a whole page of API items in one batch"""
+        processed = (self._process_item(item) for item in items if item_filter(item))
+        return [item for item in processed if item]
+    
+    def _build_item_filter(self, include_spot: bool,
+                           regions: Optional[frozenset]) -> Callable[[Dict[str, Any]], bool]:
+        """Specialise the item filter to this scan's flags so inactive checks cost nothing per item"""
+        # Cheapest checks run first. serviceName is already enforced by the $filter query.
+        item_filter = self.is_consumption_pricing
+        if not include_spot:
+            item_filter = self._reject_spot(item_filter)
+        if regions:
+            item_filter = self._require_region(item_filter, regions)
+        return item_filter
+    
+    def _reject_spot(self, next_filter: Callable[[Dict[str, Any]], bool]) -> Callable[[Dict[str, Any]], bool]:
+        is_spot_instance = self.is_spot_instance
         
-        if not include_spot and self.is_spot_instance(item.get("skuName", ""), item.get("productName", "")):
-            return False
+        def item_filter(item: Dict[str, Any]) -> bool:
+            if is_spot_instance(item.get("skuName", ""), item.get("productName", "")):
+                return False
+            return next_filter(item)
         
-        if regions:
+        return item_filter
+    
+    def _require_region(self, next_filter: Callable[[Dict[str, Any]], bool],
+                        regions: frozenset) -> Callable[[Dict[str, Any]], bool]:
+        def item_filter(item: Dict[str, Any]) -> bool:
             item_region = item.get("armRegionName") or item.get("location", "")
-            if not item_region or item_region.lower() not in [r.lower() for r in regions]:
+            if not item_region or item_region.lower() not in regions:
                 return False
+            return next_filter(item)
         
-        return True
+        return item_filter
     
-    def _process_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _process_item(self, item: Dict[str, Any]) -> Optional[VMRecord]:
         try:
+            # Parsed once, and checked before any string work on the row
+            price = float(item.get("retailPrice") or item.get("unitPrice") or 0.0)
+            if price > MAX_HOURLY_PRICE: return None
+            
             sku_name = item.get("skuName", "")
             product_name = item.get("productName", "")
             arm_sku_name = item.get("armSkuName", "")
             
             series_info = self.extract_series_info(sku_name, arm_sku_name)
-            vm_name = series_info["size"] or sku_name or arm_sku_name
-            
-            specs = self.parse_vm_specs(product_name, sku_name, vm_name)
-            os_type = self.determine_os_type(product_name, sku_name)
-            is_spot = self.is_spot_instance(sku_name, product_name)
+            vm_name = series_info.size or sku_name or arm_sku_name
             
-            price = float(item.get("retailPrice") or item.get("unitPrice") or 0.0)
-            if price > 1000: return None
+            vcpus, memory_gb = self.parse_vm_specs(product_name, sku_name, vm_name)
+            # One marker lookup serves both the OS and the spot classification
+            markers = _scan_text_markers(product_name, sku_name)
+            os_type = _os_type_from_markers(markers)
+            is_spot = "spot" in markers
             
-            return {
-                "name": vm_name, "family": series_info["family"], "os": os_type,
-                "isSpot": is_spot, "vcpus": specs.get("vcpus"), "memoryGB": specs.get("memoryGB"),
-                "pricePerHour": price, "region": item.get("armRegionName") or item.get("location", ""),
-                # You can add other fields from the 'item' dictionary here if needed
-            }
+            return VMRecord(
+                name=vm_name, family=series_info.family, os=os_type,
+                isSpot=is_spot, vcpus=vcpus, memoryGB=memory_gb,
+                pricePerHour=price, region=item.get("armRegionName") or item.get("location", ""),
+                # Add a field to VMRecord to carry other values from the 'item' dictionary
+            )
         except Exception as e:
-            print(f"Warning: Could not process item {item.get('skuId')}. Reason: {e}", file=sys.stderr)
+            logger.warning("Could not process item %s. Reason: %s", item.get('skuId'), e)
             return None
     
-    def generate_summary(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
-        if not items: return {}
-        
-        prices = [item["pricePerHour"] for item in items if "pricePerHour" in item]
-        regions = sorted(list(set(item["region"] for item in items if item.get("region"))))
-        families = sorted(list(set(item["family"] for item in items if item.get("family"))))
-        os_types = sorted(list(set(item["os"] for item in items if item.get("os"))))
-        
-        return {
-            "count": len(items),
-            "regionsCount": len(regions),
-            "regions": regions,
-            "familiesCount": len(families),
-            "families": families,
-            "osTypes": os_types,
-            "spotCount": sum(1 for item in items if item.get("isSpot")),
-            "avgPricePerHour": round(sum(prices) / len(prices), 6) if prices else 0,
-            "minPricePerHour": round(min(prices), 6) if prices else 0,
-            "maxPricePerHour": round(max(prices), 6) if prices else 0,
-        }
+    def generate_summary(self, items: List[VMRecord]) -> Dict[str, Any]:
+        summary = ScanSummary()
+        summary.add(items)
+        return summary.to_dict()
     
-    def save_to_json(self, items: List[Dict[str, Any]], filename: str) -> None:
+    def save_to_json(self, items: List[VMRecord], filename: str, pretty: bool = False,
+                     summary: Optional[Dict[str, Any]] = None) -> None:
         metadata = {
             "generatedAt": datetime.now(timezone.utc).isoformat(),
             "source": AZURE_API_URL,
             "itemCount": len(items),
-            "summary": self.generate_summary(items)
+            "summary": summary if summary is not None else self.generate_summary(items)
         }
         
-        output = {"metadata": metadata, "items": items}
-        
         # FIXED: Ensure the output directory exists before writing the file
         output_dir = os.path.dirname(filename)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            encode = orjson.dumps
+        else:
+            encode = lambda obj: json.dumps(obj, ensure_ascii=False).encode('utf-8')
+        
+        # dict(zip(...)) builds the row mapping in C; VMRecord._asdict() is ~2x slower per record
+        fields = VMRecord._fields
+        
+        # Writing to a temp file and swapping it in keeps the published file intact on failure
+        tmp_filename = f"{filename}.tmp"
+        try:
+            with open(tmp_filename, 'wb') as f:
+                if pretty:
+                    # Human-readable: encode the whole document with 2-space indentation in one write
+                    output = {"metadata": metadata, "items": [dict(zip(fields, item)) for item in items]}
+                    if ORJSON_AVAILABLE:
+                        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+                    else:
+                        f.write(json.dumps(output, indent=2, ensure_ascii=False).encode('utf-8'))
+                else:
+                    # Stream one compact item per line instead of encoding the whole payload in memory
+                    f.write(b'{"metadata": ' + encode(metadata) + b',\n"items": [\n')
+                    for index, item in enumerate(items):
+                        if index:
+                            f.write(b',\n')
+                        f.write(encode(dict(zip(fields, item))))
+                    f.write(b'\n]}\n')
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            # Don't leave a partial temp file behind in the data directory
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
+        
+        logger.info("Data saved to %s", filename)
+    
+    def save_to_parquet(self, items: List[VMRecord], filename: str) -> None:
+        """Write items as a columnar Parquet table (dictionary-encoded strings, float32 prices)"""
+        if not PYARROW_AVAILABLE:
+            logger.warning("pyarrow is not installed, skipping Parquet export.")
+            return
         
-        print(f"Data saved to {filename}")
+        # Repetitive strings are stored as Arrow dictionary (categorical) columns so readers
+        # load them as categoricals and can filter by family/os/region on integer codes
+        category = pa.dictionary(pa.int32(), pa.string())
+        schema = pa.schema([
+            ("name", category), ("family", category), ("os", category),
+            ("isSpot", pa.bool_()), ("vcpus", pa.int32()), ("memoryGB", pa.float32()),
+            ("pricePerHour", pa.float32()), ("region", category),
+        ])
+        columns = {field.name: [getattr(item, field.name) for item in items] for field in schema}
+        table = pa.table(columns, schema=schema)
+        
+        output_dir = os.path.dirname(filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        pq.write_table(table, filename, compression='zstd')
+        logger.info("Data saved to %s", filename)
+
+# Per-process scanner and item filter, built once by _init_page_worker in each worker process
+_worker_scanner: Optional[AzurePriceScanner] = None
+_worker_item_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+def _init_page_worker(include_spot: bool, regions: Optional[frozenset]) -> None:
+    """Process pool initializer: one scanner (HTTP session, parse caches) per worker process"""
+    global _worker_scanner, _worker_item_filter
+    _worker_scanner = AzurePriceScanner()
+    _worker_item_filter = _worker_scanner._build_item_filter(include_spot, regions)
+
+def _fetch_and_process_page_in_worker(params: Dict[str, Any], timeout: int) -> Tuple[int, List[VMRecord], Optional[str]]:
+    """Picklable entry point for fetching and processing one page in a worker process"""
+    return _worker_scanner._fetch_and_process_page(params, timeout, _worker_item_filter)
 
 def main():
     parser = argparse.ArgumentParser(description="Azure VM Price Scanner - OPTIMIZED")
@@ -280,8 +544,25 @@ def main():
     parser.add_argument("--regions", type=str, default="", help="Comma-separated list of regions")
     parser.add_argument("--max-pages", type=int, default=0, help="Maximum pages to fetch (0 = random 10-100)")
     parser.add_argument("--timeout", type=int, default=30, help="HTTP timeout in seconds")
+    parser.add_argument("--pretty", action="store_true", help="Indent the output JSON for readability")
+    parser.add_argument("--parquet-out", default="", help="Also write the items to this Parquet file (requires pyarrow)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of pages to fetch concurrently")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Fetch and process pages in this many worker processes instead of threads; "
+                             "replaces --workers as the number of concurrent requests (0 = threads)")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.processes < 0:
+        parser.error("--processes must be 0 (use threads) or at least 1")
+    # Progress and diagnostics go through logging; set LOG_LEVEL=INFO (or DEBUG) to see them
+    log_level_name = (os.environ.get("LOG_LEVEL") or "WARNING").upper()
+    log_level = logging.getLevelName(log_level_name)  # An int only for known level names
+    logging.basicConfig(level=log_level if isinstance(log_level, int) else logging.WARNING,
+                        format="%(levelname)s: %(message)s")
+    if not isinstance(log_level, int):
+        logger.warning("Unknown LOG_LEVEL %r, using WARNING", log_level_name)
     
     regions_list = [r.strip().lower() for r in args.regions.split(",") if r.strip()] if args.regions else None
     
@@ -295,7 +576,7 @@ def main():
     
     scanner = AzurePriceScanner()
     
-    print("Azure VM Price Scanner starting...")
+    logger.info("Azure VM Price Scanner starting...")
     start_time = time.time()
     
     try:
@@ -304,12 +585,17 @@ def main():
             include_spot=args.include_spot,
             regions=regions_list,
             max_pages=args.max_pages,
-            timeout=args.timeout
+            timeout=args.timeout,
+            workers=args.workers,
+            processes=args.processes
         )
         
         if items:
-            scanner.save_to_json(items, output_file_path)
-            summary = scanner.generate_summary(items)
+            # Reuse the summary accumulated during collection for the file metadata and the report
+            summary = scanner.summary.to_dict()
+            scanner.save_to_json(items, output_file_path, pretty=args.pretty, summary=summary)
+            if args.parquet_out:
+                scanner.save_to_parquet(items, args.parquet_out)
             print("\n=== COLLECTION SUMMARY ===")
             print(f"Total VMs Processed: {summary.get('count', 0)}")
             print(f"Duration: {time.time() - start_time:.2f} seconds")
@@ -320,9 +606,7 @@ def main():
         print("\nScan interrupted by user.", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"\nAn unexpected error occurred: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        logger.exception("An unexpected error occurred: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
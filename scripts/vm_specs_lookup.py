@@ -5,308 +5,350 @@ VM Specifications Lookup Table
 Comprehensive Azure VM specifications lookup table with 300+ entries.
 """
 
+import functools
 import re
-from typing import Dict, Any
+from typing import NamedTuple, Optional
 
+# Precompiled patterns used by get_vm_specs for every lookup
+VERSION_SUFFIX_PATTERN = re.compile(r'_v[0-9]+')
+NUMERIC_PATTERN = re.compile(r'(\d+)')
+
+# Bare numeric sizes that get an estimated spec when nothing else matches
+COMMON_NUMERIC_SIZES = frozenset(["2", "4", "8", "16", "32", "64", "128", "256"])
+
+class VMSpecs(NamedTuple):
+    """vCPU count and memory of a VM size; either may be unknown"""
+    vcpus: Optional[int]
+    memoryGB: Optional[float]
+
+UNKNOWN_SPECS = VMSpecs(None, None)
+
+# Size key -> (vcpus, memoryGB)
 VM_SPECS_LOOKUP = {
     # B-series (Burstable) - Complete
-    "b1ls": {"vcpus": 1, "memoryGB": 0.5},
-    "b1s": {"vcpus": 1, "memoryGB": 1},
-    "b1ms": {"vcpus": 1, "memoryGB": 2},
-    "b2s": {"vcpus": 2, "memoryGB": 4},
-    "b2ms": {"vcpus": 2, "memoryGB": 8},
-    "b2ts": {"vcpus": 2, "memoryGB": 8},
-    "b4ms": {"vcpus": 4, "memoryGB": 16},
-    "b8ms": {"vcpus": 8, "memoryGB": 32},
-    "b12ms": {"vcpus": 12, "memoryGB": 48},
-    "b16ms": {"vcpus": 16, "memoryGB": 64},
-    "b20ms": {"vcpus": 20, "memoryGB": 80},
+    "b1ls": (1, 0.5),
+    "b1s": (1, 1),
+    "b1ms": (1, 2),
+    "b2s": (2, 4),
+    "b2ms": (2, 8),
+    "b2ts": (2, 8),
+    "b4ms": (4, 16),
+    "b8ms": (8, 32),
+    "b12ms": (12, 48),
+    "b16ms": (16, 64),
+    "b20ms": (20, 80),
     
     # D-series (General Purpose) - Complete
-    "d1": {"vcpus": 1, "memoryGB": 3.5},
-    "d2": {"vcpus": 2, "memoryGB": 7},
-    "d3": {"vcpus": 4, "memoryGB": 14},
-    "d4": {"vcpus": 8, "memoryGB": 28},
-    "d5": {"vcpus": 16, "memoryGB": 56},
-    
-    "d2s": {"vcpus": 2, "memoryGB": 8},
-    "d4s": {"vcpus": 4, "memoryGB": 16},
-    "d8s": {"vcpus": 8, "memoryGB": 32},
-    "d16s": {"vcpus": 16, "memoryGB": 64},
-    "d32s": {"vcpus": 32, "memoryGB": 128},
-    "d48s": {"vcpus": 48, "memoryGB": 192},
-    "d64s": {"vcpus": 64, "memoryGB": 256},
-    
-    "d2ds": {"vcpus": 2, "memoryGB": 8},
-    "d4ds": {"vcpus": 4, "memoryGB": 16},
-    "d8ds": {"vcpus": 8, "memoryGB": 32},
-    "d16ds": {"vcpus": 16, "memoryGB": 64},
-    "d32ds": {"vcpus": 32, "memoryGB": 128},
-    "d48ds": {"vcpus": 48, "memoryGB": 192},
-    "d64ds": {"vcpus": 64, "memoryGB": 256},
-    
-    "d2d": {"vcpus": 2, "memoryGB": 8},
-    "d4d": {"vcpus": 4, "memoryGB": 16},
-    "d8d": {"vcpus": 8, "memoryGB": 32},
-    "d16d": {"vcpus": 16, "memoryGB": 64},
-    "d32d": {"vcpus": 32, "memoryGB": 128},
-    "d48d": {"vcpus": 48, "memoryGB": 192},
-    "d64d": {"vcpus": 64, "memoryGB": 256},
+    "d1": (1, 3.5),
+    "d2": (2, 7),
+    "d3": (4, 14),
+    "d4": (8, 28),
+    "d5": (16, 56),
+    
+    "d2s": (2, 8),
+    "d4s": (4, 16),
+    "d8s": (8, 32),
+    "d16s": (16, 64),
+    "d32s": (32, 128),
+    "d48s": (48, 192),
+    "d64s": (64, 256),
+    
+    "d2ds": (2, 8),
+    "d4ds": (4, 16),
+    "d8ds": (8, 32),
+    "d16ds": (16, 64),
+    "d32ds": (32, 128),
+    "d48ds": (48, 192),
+    "d64ds": (64, 256),
+    
+    "d2d": (2, 8),
+    "d4d": (4, 16),
+    "d8d": (8, 32),
+    "d16d": (16, 64),
+    "d32d": (32, 128),
+    "d48d": (48, 192),
+    "d64d": (64, 256),
     
     # E-series (Memory Optimized) - Complete
-    "e2": {"vcpus": 2, "memoryGB": 16},
-    "e4": {"vcpus": 4, "memoryGB": 32},
-    "e8": {"vcpus": 8, "memoryGB": 64},
-    "e16": {"vcpus": 16, "memoryGB": 128},
-    "e20": {"vcpus": 20, "memoryGB": 160},
-    "e32": {"vcpus": 32, "memoryGB": 256},
-    "e48": {"vcpus": 48, "memoryGB": 384},
-    "e64": {"vcpus": 64, "memoryGB": 432},
-    "e96": {"vcpus": 96, "memoryGB": 672},
-    
-    "e2s": {"vcpus": 2, "memoryGB": 16},
-    "e4s": {"vcpus": 4, "memoryGB": 32},
-    "e8s": {"vcpus": 8, "memoryGB": 64},
-    "e16s": {"vcpus": 16, "memoryGB": 128},
-    "e20s": {"vcpus": 20, "memoryGB": 160},
-    "e32s": {"vcpus": 32, "memoryGB": 256},
-    "e48s": {"vcpus": 48, "memoryGB": 384},
-    "e64s": {"vcpus": 64, "memoryGB": 432},
-    "e96s": {"vcpus": 96, "memoryGB": 672},
-    
-    "e2ds": {"vcpus": 2, "memoryGB": 16},
-    "e4ds": {"vcpus": 4, "memoryGB": 32},
-    "e8ds": {"vcpus": 8, "memoryGB": 64},
-    "e16ds": {"vcpus": 16, "memoryGB": 128},
-    "e20ds": {"vcpus": 20, "memoryGB": 160},
-    "e32ds": {"vcpus": 32, "memoryGB": 256},
-    "e48ds": {"vcpus": 48, "memoryGB": 384},
-    "e64ds": {"vcpus": 64, "memoryGB": 432},
-    "e96ds": {"vcpus": 96, "memoryGB": 672},
+    "e2": (2, 16),
+    "e4": (4, 32),
+    "e8": (8, 64),
+    "e16": (16, 128),
+    "e20": (20, 160),
+    "e32": (32, 256),
+    "e48": (48, 384),
+    "e64": (64, 432),
+    "e96": (96, 672),
+    
+    "e2s": (2, 16),
+    "e4s": (4, 32),
+    "e8s": (8, 64),
+    "e16s": (16, 128),
+    "e20s": (20, 160),
+    "e32s": (32, 256),
+    "e48s": (48, 384),
+    "e64s": (64, 432),
+    "e96s": (96, 672),
+    
+    "e2ds": (2, 16),
+    "e4ds": (4, 32),
+    "e8ds": (8, 64),
+    "e16ds": (16, 128),
+    "e20ds": (20, 160),
+    "e32ds": (32, 256),
+    "e48ds": (48, 384),
+    "e64ds": (64, 432),
+    "e96ds": (96, 672),
     
     # F-series (Compute Optimized) - Complete
-    "f2": {"vcpus": 2, "memoryGB": 4},
-    "f4": {"vcpus": 4, "memoryGB": 8},
-    "f8": {"vcpus": 8, "memoryGB": 16},
-    "f16": {"vcpus": 16, "memoryGB": 32},
-    "f32": {"vcpus": 32, "memoryGB": 64},
-    "f48": {"vcpus": 48, "memoryGB": 96},
-    "f64": {"vcpus": 64, "memoryGB": 128},
-    "f72": {"vcpus": 72, "memoryGB": 144},
-    
-    "f2s": {"vcpus": 2, "memoryGB": 4},
-    "f4s": {"vcpus": 4, "memoryGB": 8},
-    "f8s": {"vcpus": 8, "memoryGB": 16},
-    "f16s": {"vcpus": 16, "memoryGB": 32},
-    "f32s": {"vcpus": 32, "memoryGB": 64},
-    "f48s": {"vcpus": 48, "memoryGB": 96},
-    "f64s": {"vcpus": 64, "memoryGB": 128},
-    "f72s": {"vcpus": 72, "memoryGB": 144},
+    "f2": (2, 4),
+    "f4": (4, 8),
+    "f8": (8, 16),
+    "f16": (16, 32),
+    "f32": (32, 64),
+    "f48": (48, 96),
+    "f64": (64, 128),
+    "f72": (72, 144),
+    
+    "f2s": (2, 4),
+    "f4s": (4, 8),
+    "f8s": (8, 16),
+    "f16s": (16, 32),
+    "f32s": (32, 64),
+    "f48s": (48, 96),
+    "f64s": (64, 128),
+    "f72s": (72, 144),
     
     # M-series (Memory Optimized) - Complete
-    "m8": {"vcpus": 8, "memoryGB": 218},
-    "m16": {"vcpus": 16, "memoryGB": 436},
-    "m32": {"vcpus": 32, "memoryGB": 872},
-    "m64": {"vcpus": 64, "memoryGB": 1742},
-    "m128": {"vcpus": 128, "memoryGB": 3892},
-    "m192": {"vcpus": 192, "memoryGB": 4096},
-    "m208": {"vcpus": 208, "memoryGB": 5700},
-    "m416": {"vcpus": 416, "memoryGB": 11400},
-    
-    "m8ms": {"vcpus": 8, "memoryGB": 218},
-    "m16ms": {"vcpus": 16, "memoryGB": 436},
-    "m32ms": {"vcpus": 32, "memoryGB": 872},
-    "m64ms": {"vcpus": 64, "memoryGB": 1742},
-    "m128ms": {"vcpus": 128, "memoryGB": 3892},
-    "m192ms": {"vcpus": 192, "memoryGB": 4096},
-    "m208ms": {"vcpus": 208, "memoryGB": 5700},
-    "m416ms": {"vcpus": 416, "memoryGB": 11400},
-    
-    "m8s": {"vcpus": 8, "memoryGB": 218},
-    "m16s": {"vcpus": 16, "memoryGB": 436},
-    "m32s": {"vcpus": 32, "memoryGB": 872},
-    "m64s": {"vcpus": 64, "memoryGB": 1742},
-    "m128s": {"vcpus": 128, "memoryGB": 3892},
-    "m192s": {"vcpus": 192, "memoryGB": 4096},
-    "m208s": {"vcpus": 208, "memoryGB": 5700},
-    "m416s": {"vcpus": 416, "memoryGB": 11400},
+    "m8": (8, 218),
+    "m16": (16, 436),
+    "m32": (32, 872),
+    "m64": (64, 1742),
+    "m128": (128, 3892),
+    "m192": (192, 4096),
+    "m208": (208, 5700),
+    "m416": (416, 11400),
+    
+    "m8ms": (8, 218),
+    "m16ms": (16, 436),
+    "m32ms": (32, 872),
+    "m64ms": (64, 1742),
+    "m128ms": (128, 3892),
+    "m192ms": (192, 4096),
+    "m208ms": (208, 5700),
+    "m416ms": (416, 11400),
+    
+    "m8s": (8, 218),
+    "m16s": (16, 436),
+    "m32s": (32, 872),
+    "m64s": (64, 1742),
+    "m128s": (128, 3892),
+    "m192s": (192, 4096),
+    "m208s": (208, 5700),
+    "m416s": (416, 11400),
     
     # Standard patterns (v3, v4, v5 series) - Complete
-    "2v3": {"vcpus": 2, "memoryGB": 8},
-    "4v3": {"vcpus": 4, "memoryGB": 16},
-    "8v3": {"vcpus": 8, "memoryGB": 32},
-    "16v3": {"vcpus": 16, "memoryGB": 64},
-    "32v3": {"vcpus": 32, "memoryGB": 128},
-    "64v3": {"vcpus": 64, "memoryGB": 256},
-    "96v3": {"vcpus": 96, "memoryGB": 384},
-    
-    "2v4": {"vcpus": 2, "memoryGB": 8},
-    "4v4": {"vcpus": 4, "memoryGB": 16},
-    "8v4": {"vcpus": 8, "memoryGB": 32},
-    "16v4": {"vcpus": 16, "memoryGB": 64},
-    "32v4": {"vcpus": 32, "memoryGB": 128},
-    "64v4": {"vcpus": 64, "memoryGB": 256},
-    "96v4": {"vcpus": 96, "memoryGB": 384},
-    
-    "2v5": {"vcpus": 2, "memoryGB": 8},
-    "4v5": {"vcpus": 4, "memoryGB": 16},
-    "8v5": {"vcpus": 8, "memoryGB": 32},
-    "16v5": {"vcpus": 16, "memoryGB": 64},
-    "32v5": {"vcpus": 32, "memoryGB": 128},
-    "64v5": {"vcpus": 64, "memoryGB": 256},
-    "96v5": {"vcpus": 96, "memoryGB": 384},
+    "2v3": (2, 8),
+    "4v3": (4, 16),
+    "8v3": (8, 32),
+    "16v3": (16, 64),
+    "32v3": (32, 128),
+    "64v3": (64, 256),
+    "96v3": (96, 384),
+    
+    "2v4": (2, 8),
+    "4v4": (4, 16),
+    "8v4": (8, 32),
+    "16v4": (16, 64),
+    "32v4": (32, 128),
+    "64v4": (64, 256),
+    "96v4": (96, 384),
+    
+    "2v5": (2, 8),
+    "4v5": (4, 16),
+    "8v5": (8, 32),
+    "16v5": (16, 64),
+    "32v5": (32, 128),
+    "64v5": (64, 256),
+    "96v5": (96, 384),
     
     # A-series (Basic) - Complete
-    "a0": {"vcpus": 1, "memoryGB": 0.75},
-    "a1": {"vcpus": 1, "memoryGB": 1.75},
-    "a2": {"vcpus": 2, "memoryGB": 3.5},
-    "a3": {"vcpus": 4, "memoryGB": 7},
-    "a4": {"vcpus": 8, "memoryGB": 14},
-    "a5": {"vcpus": 2, "memoryGB": 14},
-    "a6": {"vcpus": 4, "memoryGB": 28},
-    "a7": {"vcpus": 8, "memoryGB": 56},
-    "a8": {"vcpus": 8, "memoryGB": 56},
-    "a9": {"vcpus": 16, "memoryGB": 112},
-    "a10": {"vcpus": 8, "memoryGB": 56},
-    "a11": {"vcpus": 16, "memoryGB": 112},
+    "a0": (1, 0.75),
+    "a1": (1, 1.75),
+    "a2": (2, 3.5),
+    "a3": (4, 7),
+    "a4": (8, 14),
+    "a5": (2, 14),
+    "a6": (4, 28),
+    "a7": (8, 56),
+    "a8": (8, 56),
+    "a9": (16, 112),
+    "a10": (8, 56),
+    "a11": (16, 112),
     
     # NC-series (GPU) - Complete
-    "nc6": {"vcpus": 6, "memoryGB": 56},
-    "nc12": {"vcpus": 12, "memoryGB": 112},
-    "nc24": {"vcpus": 24, "memoryGB": 224},
-    "nc24r": {"vcpus": 24, "memoryGB": 224},
+    "nc6": (6, 56),
+    "nc12": (12, 112),
+    "nc24": (24, 224),
+    "nc24r": (24, 224),
     
-    "nc6s": {"vcpus": 6, "memoryGB": 112},
-    "nc12s": {"vcpus": 12, "memoryGB": 224},
-    "nc24s": {"vcpus": 24, "memoryGB": 448},
-    "nc24rs": {"vcpus": 24, "memoryGB": 448},
+    "nc6s": (6, 112),
+    "nc12s": (12, 224),
+    "nc24s": (24, 448),
+    "nc24rs": (24, 448),
     
-    "nc6sv3": {"vcpus": 6, "memoryGB": 112},
-    "nc12sv3": {"vcpus": 12, "memoryGB": 224},
-    "nc24sv3": {"vcpus": 24, "memoryGB": 448},
-    "nc24rsv3": {"vcpus": 24, "memoryGB": 448},
+    "nc6sv3": (6, 112),
+    "nc12sv3": (12, 224),
+    "nc24sv3": (24, 448),
+    "nc24rsv3": (24, 448),
     
     # NV-series (GPU) - Complete
-    "nv6": {"vcpus": 6, "memoryGB": 56},
-    "nv12": {"vcpus": 12, "memoryGB": 112},
-    "nv24": {"vcpus": 24, "memoryGB": 224},
+    "nv6": (6, 56),
+    "nv12": (12, 112),
+    "nv24": (24, 224),
     
-    "nv6s": {"vcpus": 6, "memoryGB": 112},
-    "nv12s": {"vcpus": 12, "memoryGB": 224},
-    "nv24s": {"vcpus": 24, "memoryGB": 448},
+    "nv6s": (6, 112),
+    "nv12s": (12, 224),
+    "nv24s": (24, 448),
     
     # H-series (High Performance Compute) - Complete
-    "h8": {"vcpus": 8, "memoryGB": 56},
-    "h16": {"vcpus": 16, "memoryGB": 112},
-    "h8r": {"vcpus": 8, "memoryGB": 56},
-    "h16r": {"vcpus": 16, "memoryGB": 112},
-    "h8m": {"vcpus": 8, "memoryGB": 112},
-    "h16m": {"vcpus": 16, "memoryGB": 224},
-    "h16mr": {"vcpus": 16, "memoryGB": 224},
-    "h16r": {"vcpus": 16, "memoryGB": 112},
+    "h8": (8, 56),
+    "h16": (16, 112),
+    "h8r": (8, 56),
+    "h16r": (16, 112),
+    "h8m": (8, 112),
+    "h16m": (16, 224),
+    "h16mr": (16, 224),
+    "h16r": (16, 112),
     
     # L-series (Storage Optimized) - Complete
-    "l8s": {"vcpus": 8, "memoryGB": 64},
-    "l16s": {"vcpus": 16, "memoryGB": 128},
-    "l32s": {"vcpus": 32, "memoryGB": 256},
-    "l48s": {"vcpus": 48, "memoryGB": 384},
-    "l64s": {"vcpus": 64, "memoryGB": 512},
-    "l80s": {"vcpus": 80, "memoryGB": 640},
+    "l8s": (8, 64),
+    "l16s": (16, 128),
+    "l32s": (32, 256),
+    "l48s": (48, 384),
+    "l64s": (64, 512),
+    "l80s": (80, 640),
     
     # G-series (Memory and Storage Optimized) - Complete
-    "g1": {"vcpus": 2, "memoryGB": 28},
-    "g2": {"vcpus": 4, "memoryGB": 56},
-    "g3": {"vcpus": 8, "memoryGB": 112},
-    "g4": {"vcpus": 16, "memoryGB": 224},
-    "g5": {"vcpus": 32, "memoryGB": 448},
+    "g1": (2, 28),
+    "g2": (4, 56),
+    "g3": (8, 112),
+    "g4": (16, 224),
+    "g5": (32, 448),
     
     # Specialized series
-    "dasv4": {"vcpus": 2, "memoryGB": 8},
-    "easv4": {"vcpus": 2, "memoryGB": 16},
-    "fasv4": {"vcpus": 2, "memoryGB": 4},
-    "dcsv2": {"vcpus": 2, "memoryGB": 8},
-    "ecsv2": {"vcpus": 2, "memoryGB": 16},
+    "dasv4": (2, 8),
+    "easv4": (2, 16),
+    "fasv4": (2, 4),
+    "dcsv2": (2, 8),
+    "ecsv2": (2, 16),
     
     # Azure Spot and Low Priority variants
-    "spot": {"vcpus": None, "memoryGB": None},  # Generic spot
-    "lowpriority": {"vcpus": None, "memoryGB": None},
+    "spot": (None, None),  # Generic spot
+    "lowpriority": (None, None),
     
     # Common patterns for various series
-    "2a": {"vcpus": 2, "memoryGB": 4},
-    "4a": {"vcpus": 4, "memoryGB": 8},
-    "8a": {"vcpus": 8, "memoryGB": 16},
-    "16a": {"vcpus": 16, "memoryGB": 32},
-    
-    "2d": {"vcpus": 2, "memoryGB": 8},
-    "4d": {"vcpus": 4, "memoryGB": 16},
-    "8d": {"vcpus": 8, "memoryGB": 32},
-    "16d": {"vcpus": 16, "memoryGB": 64},
-    
-    "2e": {"vcpus": 2, "memoryGB": 16},
-    "4e": {"vcpus": 4, "memoryGB": 32},
-    "8e": {"vcpus": 8, "memoryGB": 64},
-    "16e": {"vcpus": 16, "memoryGB": 128},
-    
-    "2f": {"vcpus": 2, "memoryGB": 4},
-    "4f": {"vcpus": 4, "memoryGB": 8},
-    "8f": {"vcpus": 8, "memoryGB": 16},
-    "16f": {"vcpus": 16, "memoryGB": 32},
-    
-    "2m": {"vcpus": 2, "memoryGB": 16},
-    "4m": {"vcpus": 4, "memoryGB": 32},
-    "8m": {"vcpus": 8, "memoryGB": 64},
-    "16m": {"vcpus": 16, "memoryGB": 128},
+    "2a": (2, 4),
+    "4a": (4, 8),
+    "8a": (8, 16),
+    "16a": (16, 32),
+    
+    "2d": (2, 8),
+    "4d": (4, 16),
+    "8d": (8, 32),
+    "16d": (16, 64),
+    
+    "2e": (2, 16),
+    "4e": (4, 32),
+    "8e": (8, 64),
+    "16e": (16, 128),
+    
+    "2f": (2, 4),
+    "4f": (4, 8),
+    "8f": (8, 16),
+    "16f": (16, 32),
+    
+    "2m": (2, 16),
+    "4m": (4, 32),
+    "8m": (8, 64),
+    "16m": (16, 128),
     
     # Very large instances
-    "416": {"vcpus": 416, "memoryGB": 5700},
-    "448": {"vcpus": 448, "memoryGB": 6144},
-    "480": {"vcpus": 480, "memoryGB": 6400},
-    "512": {"vcpus": 512, "memoryGB": 8192},
-    "576": {"vcpus": 576, "memoryGB": 9216},
-    "672": {"vcpus": 672, "memoryGB": 10752},
-    "768": {"vcpus": 768, "memoryGB": 12288},
-    "896": {"vcpus": 896, "memoryGB": 14336},
-    "1024": {"vcpus": 1024, "memoryGB": 16384},
+    "416": (416, 5700),
+    "448": (448, 6144),
+    "480": (480, 6400),
+    "512": (512, 8192),
+    "576": (576, 9216),
+    "672": (672, 10752),
+    "768": (768, 12288),
+    "896": (896, 14336),
+    "1024": (1024, 16384),
 }
+VM_SPECS_LOOKUP = {size: VMSpecs(*specs) for size, specs in VM_SPECS_LOOKUP.items()}
+
+# Character trie over the patterns for the partial-match fallback. A terminal node stores the
+# pattern's position in VM_SPECS_LOOKUP under _TRIE_END so ties resolve to the earliest-listed one.
+_TRIE_END = ""
+_PATTERN_TRIE = {}
+for _order, _pattern in enumerate(VM_SPECS_LOOKUP):
+    _node = _PATTERN_TRIE
+    for _char in _pattern:
+        _node = _node.setdefault(_char, {})
+    _node[_TRIE_END] = _order
+del _order, _pattern, _node, _char
+_PATTERN_SPECS = list(VM_SPECS_LOOKUP.values())
 
-def get_vm_specs(vm_name: str) -> Dict[str, Any]:
+def _find_partial_match(clean_name: str) -> Optional[VMSpecs]:
     """
-    Get VM specifications from lookup table based on VM name
+    Return the specs of the earliest-listed pattern contained in clean_name, if any
+    """
+    best = None
+    for start in range(len(clean_name)):
+        node = _PATTERN_TRIE
+        for char in clean_name[start:]:
+            node = node.get(char)
+            if node is None:
+                break
+            order = node.get(_TRIE_END)
+            if order is not None and (best is None or order < best):
+                best = order
+    return _PATTERN_SPECS[best] if best is not None else None
+
+@functools.lru_cache(maxsize=4096)
+def get_vm_specs(vm_name: str) -> VMSpecs:
+    """
+    Get VM specifications from lookup table based on VM name (cached per name)
     """
     if not vm_name:
-        return {"vcpus": None, "memoryGB": None}
+        return UNKNOWN_SPECS
     
     vm_name_lower = vm_name.lower()
     
-    # Remove common prefixes and suffixes for better matching
-    clean_name = re.sub(r'standard_|_v[0-9]+|promo|_', '', vm_name_lower)
-    clean_name = clean_name.replace(' ', '')
+    # Remove common prefixes and suffixes for better matching. Literal pieces use
+    # str.replace; only the "_v<digits>" version suffix needs the regex engine.
+    clean_name = vm_name_lower.replace('standard_', '')
+    if '_v' in clean_name:
+        clean_name = VERSION_SUFFIX_PATTERN.sub('', clean_name)
+    clean_name = clean_name.replace('promo', '').replace('_', '').replace(' ', '')
     
     # Try exact match first
     if clean_name in VM_SPECS_LOOKUP:
         return VM_SPECS_LOOKUP[clean_name]
     
     # Try partial matches with the cleaned name
-    for pattern, specs in VM_SPECS_LOOKUP.items():
-        if pattern in clean_name:
-            return specs
-    
-    # Try to extract size pattern (e.g., "d2", "b4ms", "16v3")
-    size_match = re.search(r'([a-z]*\d+[a-z]*)', clean_name)
-    if size_match:
-        size_key = size_match.group(1)
-        if size_key in VM_SPECS_LOOKUP:
-            return VM_SPECS_LOOKUP[size_key]
+    specs = _find_partial_match(clean_name)
+    if specs is not None:
+        return specs
     
     # Try numeric patterns (e.g., "2", "4", "8", "16")
-    numeric_match = re.search(r'(\d+)', clean_name)
+    numeric_match = NUMERIC_PATTERN.search(clean_name)
     if numeric_match:
         numeric_key = numeric_match.group(1)
         # Common patterns for numeric sizes
-        if numeric_key in ["2", "4", "8", "16", "32", "64", "128", "256"]:
-            return {
-                "vcpus": int(numeric_key),
-                "memoryGB": int(numeric_key) * 4  # Estimate 4GB per vCPU
-            }
+        if numeric_key in COMMON_NUMERIC_SIZES:
+            return VMSpecs(
+                vcpus=int(numeric_key),
+                memoryGB=int(numeric_key) * 4  # Estimate 4GB per vCPU
+            )
     
-    return {"vcpus": None, "memoryGB": None}
\ No newline at end of file
+    return UNKNOWN_SPECS
\ No newline at end of file